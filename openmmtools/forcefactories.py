@@ -32,7 +32,7 @@ from openmmtools import forces
 # =============================================================================
 
 def replace_reaction_field(reference_system, switch_width=1.0*unit.angstrom,
-                           return_copy=True, shifted=False):
+                           return_copy=True, shifted=False, tabulated=False):
     """Return a system converted to use a switched reaction-field electrostatics using :class:`openmmtools.forces.UnshiftedReactionField`.
 
     This will add an `UnshiftedReactionFieldForce` or `SwitchedReactionFieldForce`
@@ -55,6 +55,9 @@ def replace_reaction_field(reference_system, switch_width=1.0*unit.angstrom,
         the `reference_system` object.
     shifted : bool, optional, default=False
         If `True`, a shifted reaction-field will be used.
+    tabulated : bool, optional, default=False
+        If `True`, the reaction-field potential is interpolated from a
+        tabulated function instead of being evaluated analytically.
 
     Returns
     -------
@@ -75,7 +78,8 @@ def replace_reaction_field(reference_system, switch_width=1.0*unit.angstrom,
     # Add an reaction field for each CutoffPeriodic NonbondedForce.
     for reference_force in forces.find_forces(system, openmm.NonbondedForce).values():
         if reference_force.getNonbondedMethod() == openmm.NonbondedForce.CutoffPeriodic:
-            reaction_field_force = force_constructor.from_nonbonded_force(reference_force, switch_width=switch_width)
+            reaction_field_force = force_constructor.from_nonbonded_force(
+                reference_force, switch_width=switch_width, tabulated=tabulated)
             system.addForce(reaction_field_force)
 
             # Remove particle electrostatics from reference force, but leave exceptions.
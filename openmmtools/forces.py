@@ -17,7 +17,9 @@ Custom OpenMM Forces classes and utilities.
 import abc
 import collections
 import copy
+import functools
 import inspect
+import itertools
 import logging
 import math
 import re
@@ -141,6 +143,9 @@ def find_forces(system, force_type, only_one=False, include_subclasses=False):
         # Check if the force class matches the requirements.
         elif type(force) is force_type or (include_subclasses and isinstance(force, force_type)):
             forces[force_idx] = force
+        # Stop scanning the system as soon as multiple matches are found.
+        if only_one is True and len(forces) > 1:
+            raise MultipleForcesError('Found multiple forces of type {}'.format(force_type))
 
     # Second pass to find all subclasses of the matching forces.
     if include_subclasses and re_pattern is not None:
@@ -1107,155 +1112,177 @@ class FlatBottomRestraintBondForce(FlatBottomRestraintForceMixIn,
 # REACTION FIELD
 # =============================================================================
 
-class UnshiftedReactionFieldForce(openmm.CustomNonbondedForce):
-    """A force modelling switched reaction-field electrostatics.
-
-    Contrarily to a normal `NonbondedForce` with `CutoffPeriodic` nonbonded
-    method, this force sets the `c_rf` to 0.0 and uses a switching function
-    to avoid forces discontinuities at the cutoff distance.
+def _compute_rf_constants(cutoff_distance_nm, reaction_field_dielectric):
+    """Compute the reaction field constants k_rf and c_rf in OpenMM units.
 
     Parameters
     ----------
-    cutoff_distance : openmm.unit.Quantity, default 15*angstroms
-        The cutoff distance (units of distance).
-    switch_width : openmm.unit.Quantity, default 1.0*angstrom
-        Switch width for electrostatics (units of distance).
+    cutoff_distance_nm : float
+        The cutoff distance in nanometers.
     reaction_field_dielectric : float
         The dielectric constant used for the solvent.
 
+    Returns
+    -------
+    k_rf : float
+        The reaction field constant in units of nm**-3.
+    c_rf : float
+        The reaction field constant in units of nm**-1.
+
     """
+    inverse_cutoff = 1.0 / cutoff_distance_nm
+    denominator = 2.0*reaction_field_dielectric + 1.0
+    k_rf = inverse_cutoff*inverse_cutoff*inverse_cutoff * (reaction_field_dielectric - 1.0) / denominator
+    c_rf = inverse_cutoff * (3.0*reaction_field_dielectric) / denominator
+    return k_rf, c_rf
 
-    def __init__(self, cutoff_distance=15*unit.angstroms, switch_width=1.0*unit.angstrom,
-                 reaction_field_dielectric=78.3):
-        k_rf = cutoff_distance**(-3) * (reaction_field_dielectric - 1.0) / (2.0*reaction_field_dielectric + 1.0)
 
-        # Energy expression omits c_rf constant term.
-        energy_expression = "ONE_4PI_EPS0*chargeprod*(r^(-1) + k_rf*r^2);"
-        energy_expression += "chargeprod = charge1*charge2;"
-        energy_expression += "k_rf = {:f};".format(k_rf.value_in_unit_system(unit.md_unit_system))
-        energy_expression += "ONE_4PI_EPS0 = {:f};".format(ONE_4PI_EPS0)  # already in OpenMM units
+def _get_exception_atom_pairs(nonbonded_force):
+    """Return the atom indices of all the exceptions in a `NonbondedForce`.
 
-        # Create CustomNonbondedForce.
-        super(UnshiftedReactionFieldForce, self).__init__(energy_expression)
+    The indices are read in a single pass over the exceptions, discarding
+    the exception parameters.
 
-        # Add parameters.
-        self.addPerParticleParameter("charge")
+    Parameters
+    ----------
+    nonbonded_force : openmm.NonbondedForce
+        The nonbonded force containing the exceptions.
 
-        # Configure force.
-        self.setNonbondedMethod(openmm.CustomNonbondedForce.CutoffPeriodic)
-        self.setCutoffDistance(cutoff_distance)
-        self.setUseLongRangeCorrection(False)
-        if switch_width is not None:
-            self.setUseSwitchingFunction(True)
-            self.setSwitchingDistance(cutoff_distance - switch_width)
-        else:  # Truncated
-            self.setUseSwitchingFunction(False)
+    Returns
+    -------
+    atom_pairs : numpy.ndarray
+        An array of shape (n_exceptions, 2) with the atom indices of
+        each exception.
 
-    @classmethod
-    def from_nonbonded_force(cls, nonbonded_force, switch_width=1.0*unit.angstrom):
-        """Copy constructor from an OpenMM `NonbondedForce`.
+    """
+    n_exceptions = nonbonded_force.getNumExceptions()
+    get_exception_parameters = nonbonded_force.getExceptionParameters
+    atom_pairs = np.fromiter(
+        itertools.chain.from_iterable(get_exception_parameters(exception_index)[:2]
+                                      for exception_index in range(n_exceptions)),
+        dtype=np.int32, count=2*n_exceptions
+    )
+    return atom_pairs.reshape((n_exceptions, 2))
 
-        The returned force has same cutoff distance and dielectric, and
-        its particles have the same charges. Exclusions corresponding to
-        `nonbonded_force` exceptions are also added.
 
-        .. warning
-            This only creates the force object. The electrostatics in
-            `nonbonded_force` remains unmodified. Use the function
-            `replace_reaction_field` to correctly convert a system to
-            use an unshifted reaction field potential.
+@functools.lru_cache(maxsize=32)
+def _reaction_field_energy_expression(cutoff_distance_nm, reaction_field_dielectric, shifted):
+    """Build the energy expression of the reaction field forces.
 
-        Parameters
-        ----------
-        nonbonded_force : openmm.NonbondedForce
-            The nonbonded force to copy.
-        switch_width : openmm.unit.Quantity
-            Switch width for electrostatics (units of distance).
-
-        Returns
-        -------
-        reaction_field_force : UnshiftedReactionFieldForce
-            The reaction field force with copied particles.
-
-        """
-        # OpenMM gives unitless values.
-        cutoff_distance = nonbonded_force.getCutoffDistance()
-        reaction_field_dielectric = nonbonded_force.getReactionFieldDielectric()
-        reaction_field_force = cls(cutoff_distance, switch_width, reaction_field_dielectric)
+    The result is cached since alchemical and multistate setups tend
+    to create many forces with identical parameters.
 
-        # Set particle charges.
-        for particle_index in range(nonbonded_force.getNumParticles()):
-            charge, sigma, epsilon = nonbonded_force.getParticleParameters(particle_index)
-            reaction_field_force.addParticle([charge])
+    Parameters
+    ----------
+    cutoff_distance_nm : float
+        The cutoff distance in nanometers.
+    reaction_field_dielectric : float
+        The dielectric constant used for the solvent.
+    shifted : bool
+        If True, the energy includes the `c_rf` constant term.
 
-        # Add exclusions to CustomNonbondedForce.
-        for exception_index in range(nonbonded_force.getNumExceptions()):
-            iatom, jatom, chargeprod, sigma, epsilon = nonbonded_force.getExceptionParameters(exception_index)
-            reaction_field_force.addExclusion(iatom, jatom)
+    Returns
+    -------
+    energy_expression : str
+        The energy expression for the `CustomNonbondedForce`.
 
-        return reaction_field_force
+    """
+    k_rf, c_rf = _compute_rf_constants(cutoff_distance_nm, reaction_field_dielectric)
 
-    @classmethod
-    def from_system(cls, system, switch_width=1.0*unit.angstrom):
-        """Copy constructor from the first OpenMM `NonbondedForce` in `system`.
+    # ONE_4PI_EPS0 is distributed over the terms in parentheses and folded
+    # into the constants to save a multiplication per pair.
+    if shifted:
+        energy_expression = "charge1*charge2*(ONE_4PI_EPS0/r + scaled_k_rf*r^2 - scaled_c_rf);"
+    else:
+        # Energy expression omits c_rf constant term.
+        energy_expression = "charge1*charge2*(ONE_4PI_EPS0/r + scaled_k_rf*r^2);"
+    energy_expression += "scaled_k_rf = {:f};".format(ONE_4PI_EPS0 * k_rf)
+    if shifted:
+        energy_expression += "scaled_c_rf = {:f};".format(ONE_4PI_EPS0 * c_rf)
+    energy_expression += "ONE_4PI_EPS0 = {:f};".format(ONE_4PI_EPS0)  # already in OpenMM units
+    return energy_expression
 
-        If multiple `NonbondedForce`s are found, an exception is raised.
 
-        .. warning
-            This only creates the force object. The electrostatics in
-            `nonbonded_force` remains unmodified. Use the function
-            `replace_reaction_field` to correctly convert a system to
-            use an unshifted reaction field potential.
+@functools.lru_cache(maxsize=32)
+def _reaction_field_kernel_table(cutoff_distance_nm, reaction_field_dielectric, shifted,
+                                 n_points=4096):
+    """Tabulate the distance dependence of the reaction field energy.
 
-        Parameters
-        ----------
-        system : openmm.System
-            The system containing the nonbonded force to copy.
-        switch_width : openmm.unit.Quantity
-            Switch width for electrostatics (units of distance).
+    The values are tabulated on a uniform grid between 0 and the cutoff
+    distance for use with an `openmm.Continuous1DFunction`. The value at
+    r = 0 is set to 0.0 to avoid the singularity.
 
-        Returns
-        -------
-        reaction_field_force : UnshiftedReactionFieldForce
-            The reaction field force.
+    Parameters
+    ----------
+    cutoff_distance_nm : float
+        The cutoff distance in nanometers.
+    reaction_field_dielectric : float
+        The dielectric constant used for the solvent.
+    shifted : bool
+        If True, the energy includes the `c_rf` constant term.
+    n_points : int, optional
+        The number of grid points (default is 4096).
 
-        See Also
-        --------
-        UnshiftedReactionField.from_nonbonded_force
+    Returns
+    -------
+    values : tuple of float
+        The energy per unit charge product at each grid point in OpenMM units.
 
-        """
-        force_idx, nonbonded_force = find_forces(system, openmm.NonbondedForce, only_one=True)
-        return cls.from_nonbonded_force(nonbonded_force, switch_width)
+    """
+    k_rf, c_rf = _compute_rf_constants(cutoff_distance_nm, reaction_field_dielectric)
+    if not shifted:
+        c_rf = 0.0
+    distances = np.linspace(0.0, cutoff_distance_nm, n_points)
+    with np.errstate(divide='ignore'):
+        values = ONE_4PI_EPS0 * (1/distances + k_rf*distances**2 - c_rf)
+    values[0] = 0.0
+    return tuple(values.tolist())
 
 
-class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
-    """A force modelling switched reaction-field electrostatics.
+class _ReactionFieldBase(openmm.CustomNonbondedForce):
+    """Shared implementation of the reaction field forces.
 
     Parameters
     ----------
-    cutoff_distance : openmm.unit.Quantity, default 15*angstroms
+    cutoff_distance : openmm.unit.Quantity
         The cutoff distance (units of distance).
-    switch_width : openmm.unit.Quantity, default 1.0*angstrom
-        Switch width for electrostatics (units of distance).
+    switch_width : openmm.unit.Quantity or None
+        Switch width for electrostatics (units of distance). If None or
+        zero, the potential is truncated at the cutoff.
     reaction_field_dielectric : float
         The dielectric constant used for the solvent.
+    tabulated : bool
+        If True, the distance dependence of the potential is tabulated.
+    shifted : bool
+        If True, the energy includes the `c_rf` constant term.
+
+    Raises
+    ------
+    ValueError
+        If ``switch_width`` is negative or not smaller than ``cutoff_distance``.
 
     """
 
-    def __init__(self, cutoff_distance=15*unit.angstroms, switch_width=1.0*unit.angstrom,
-                 reaction_field_dielectric=78.3):
-        k_rf = cutoff_distance**(-3) * (reaction_field_dielectric - 1.0) / (2.0*reaction_field_dielectric + 1.0)
-        c_rf = cutoff_distance**(-1) * (3*reaction_field_dielectric) / (2.0*reaction_field_dielectric + 1.0)
+    def __init__(self, cutoff_distance, switch_width, reaction_field_dielectric,
+                 tabulated, shifted):
+        if switch_width is not None and not (0.0*unit.nanometers <= switch_width < cutoff_distance):
+            raise ValueError('The switch width ({}) must be non-negative and smaller than '
+                             'the cutoff distance ({}).'.format(switch_width, cutoff_distance))
+        cutoff_distance_nm = cutoff_distance.value_in_unit(unit.nanometers)
 
-        # Energy expression omits c_rf constant term.
-        energy_expression = "ONE_4PI_EPS0*chargeprod*(r^(-1) + k_rf*r^2 - c_rf);"
-        energy_expression += "chargeprod = charge1*charge2;"
-        energy_expression += "k_rf = {:f};".format(k_rf.value_in_unit_system(unit.md_unit_system))
-        energy_expression += "c_rf = {:f};".format(c_rf.value_in_unit_system(unit.md_unit_system))
-        energy_expression += "ONE_4PI_EPS0 = {:f};".format(ONE_4PI_EPS0)  # already in OpenMM units
+        if tabulated:
+            energy_expression = "rf_kernel(r)*charge1*charge2;"
+        else:
+            energy_expression = _reaction_field_energy_expression(
+                cutoff_distance_nm, reaction_field_dielectric, shifted)
 
         # Create CustomNonbondedForce.
-        super(SwitchedReactionFieldForce, self).__init__(energy_expression)
+        super(_ReactionFieldBase, self).__init__(energy_expression)
+        if tabulated:
+            kernel_values = _reaction_field_kernel_table(
+                cutoff_distance_nm, reaction_field_dielectric, shifted)
+            self.addTabulatedFunction("rf_kernel", openmm.Continuous1DFunction(
+                list(kernel_values), 0.0, cutoff_distance_nm))
 
         # Add parameters.
         self.addPerParticleParameter("charge")
@@ -1264,14 +1291,17 @@ class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
         self.setNonbondedMethod(openmm.CustomNonbondedForce.CutoffPeriodic)
         self.setCutoffDistance(cutoff_distance)
         self.setUseLongRangeCorrection(False)
-        if switch_width is not None:
+        # A zero-width switch is plain truncation, and OpenMM rejects a
+        # switching distance equal to the cutoff.
+        if switch_width is not None and switch_width > 0.0*unit.nanometers:
             self.setUseSwitchingFunction(True)
             self.setSwitchingDistance(cutoff_distance - switch_width)
         else:  # Truncated
             self.setUseSwitchingFunction(False)
 
     @classmethod
-    def from_nonbonded_force(cls, nonbonded_force, switch_width=1.0*unit.angstrom):
+    def from_nonbonded_force(cls, nonbonded_force, switch_width=1.0*unit.angstrom,
+                             tabulated=False):
         """Copy constructor from an OpenMM `NonbondedForce`.
 
         The returned force has same cutoff distance and dielectric, and
@@ -1281,8 +1311,10 @@ class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
         .. warning
             This only creates the force object. The electrostatics in
             `nonbonded_force` remains unmodified. Use the function
-            `replace_reaction_field` to correctly convert a system to
-            use an unshifted reaction field potential.
+            `replace_reaction_field` (with ``shifted=False`` for
+            `UnshiftedReactionFieldForce` or ``shifted=True`` for
+            `SwitchedReactionFieldForce`) to correctly convert a system
+            to use a reaction field potential.
 
         Parameters
         ----------
@@ -1290,32 +1322,47 @@ class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
             The nonbonded force to copy.
         switch_width : openmm.unit.Quantity
             Switch width for electrostatics (units of distance).
+        tabulated : bool, default False
+            If True, the distance dependence of the potential is interpolated
+            from a cubic spline tabulated between 0 and the cutoff distance
+            instead of being evaluated analytically.
 
         Returns
         -------
-        reaction_field_force : UnshiftedReactionFieldForce
+        reaction_field_force : UnshiftedReactionFieldForce or SwitchedReactionFieldForce
             The reaction field force with copied particles.
 
         """
         # OpenMM gives unitless values.
         cutoff_distance = nonbonded_force.getCutoffDistance()
         reaction_field_dielectric = nonbonded_force.getReactionFieldDielectric()
-        reaction_field_force = cls(cutoff_distance, switch_width, reaction_field_dielectric)
-
-        # Set particle charges.
-        for particle_index in range(nonbonded_force.getNumParticles()):
-            charge, sigma, epsilon = nonbonded_force.getParticleParameters(particle_index)
-            reaction_field_force.addParticle([charge])
-
-        # Add exclusions to CustomNonbondedForce.
-        for exception_index in range(nonbonded_force.getNumExceptions()):
-            iatom, jatom, chargeprod, sigma, epsilon = nonbonded_force.getExceptionParameters(exception_index)
-            reaction_field_force.addExclusion(iatom, jatom)
+        reaction_field_force = cls(cutoff_distance, switch_width, reaction_field_dielectric,
+                                   tabulated=tabulated)
+
+        # Set particle charges. OpenMM returns charges in units of elementary
+        # charge so the unit conversion can be skipped.
+        n_particles = nonbonded_force.getNumParticles()
+        get_particle_parameters = nonbonded_force.getParticleParameters
+        charges = np.fromiter(
+            (get_particle_parameters(particle_index)[0]._value
+             for particle_index in range(n_particles)),
+            dtype=np.float64, count=n_particles
+        )
+        add_particle = reaction_field_force.addParticle
+        for charge in charges.tolist():
+            add_particle([charge])
+
+        # Add exclusions to CustomNonbondedForce. Treating each exception as
+        # a bond with a cutoff of one bond excludes exactly those pairs, and
+        # lets OpenMM add all the exclusions in a single call.
+        atom_pairs = _get_exception_atom_pairs(nonbonded_force)
+        reaction_field_force.createExclusionsFromBonds(
+            [tuple(atom_pair) for atom_pair in atom_pairs.tolist()], 1)
 
         return reaction_field_force
 
     @classmethod
-    def from_system(cls, system, switch_width=1.0*unit.angstrom):
+    def from_system(cls, system, switch_width=1.0*unit.angstrom, tabulated=False):
         """Copy constructor from the first OpenMM `NonbondedForce` in `system`.
 
         If multiple `NonbondedForce`s are found, an exception is raised.
@@ -1323,8 +1370,10 @@ class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
         .. warning
             This only creates the force object. The electrostatics in
             `nonbonded_force` remains unmodified. Use the function
-            `replace_reaction_field` to correctly convert a system to
-            use an unshifted reaction field potential.
+            `replace_reaction_field` (with ``shifted=False`` for
+            `UnshiftedReactionFieldForce` or ``shifted=True`` for
+            `SwitchedReactionFieldForce`) to correctly convert a system
+            to use a reaction field potential.
 
         Parameters
         ----------
@@ -1332,19 +1381,146 @@ class SwitchedReactionFieldForce(openmm.CustomNonbondedForce):
             The system containing the nonbonded force to copy.
         switch_width : openmm.unit.Quantity
             Switch width for electrostatics (units of distance).
+        tabulated : bool, default False
+            If True, the distance dependence of the potential is interpolated
+            from a cubic spline tabulated between 0 and the cutoff distance
+            instead of being evaluated analytically.
 
         Returns
         -------
-        reaction_field_force : UnshiftedReactionFieldForce
+        reaction_field_force : UnshiftedReactionFieldForce or SwitchedReactionFieldForce
             The reaction field force.
 
         See Also
         --------
-        UnshiftedReactionField.from_nonbonded_force
+        _ReactionFieldBase.from_nonbonded_force
 
         """
         force_idx, nonbonded_force = find_forces(system, openmm.NonbondedForce, only_one=True)
-        return cls.from_nonbonded_force(nonbonded_force, switch_width)
+        return cls.from_nonbonded_force(nonbonded_force, switch_width, tabulated=tabulated)
+
+    @classmethod
+    def build_native(cls, cutoff_distance=15*unit.angstroms, switch_width=None,
+                     reaction_field_dielectric=78.3):
+        """Create an equivalent built-in OpenMM `NonbondedForce`.
+
+        The returned force uses the `CutoffPeriodic` nonbonded method, which
+        OpenMM evaluates with its optimized native kernels rather than with
+        the expression evaluator used by `CustomNonbondedForce`.
+
+        Energies and forces are identical to those of a truncated
+        `SwitchedReactionFieldForce` (i.e., with ``switch_width=None``).
+
+        .. warning
+            The native force always includes the `c_rf` constant term. Forces
+            are identical to those of a truncated `UnshiftedReactionFieldForce`,
+            but the energy of each pair within the cutoff is shifted by
+            ``-ONE_4PI_EPS0*charge1*charge2*c_rf``.
+
+        The force is returned empty. Particles should be added with zero
+        Lennard-Jones parameters (i.e., ``addParticle(charge, 1.0, 0.0)``).
+
+        Parameters
+        ----------
+        cutoff_distance : openmm.unit.Quantity, default 15*angstroms
+            The cutoff distance (units of distance).
+        switch_width : openmm.unit.Quantity, optional
+            Must be None or zero. `NonbondedForce` applies the switching function
+            only to the Lennard-Jones interactions so switched electrostatics
+            cannot be represented natively.
+        reaction_field_dielectric : float
+            The dielectric constant used for the solvent.
+
+        Returns
+        -------
+        nonbonded_force : openmm.NonbondedForce
+            The native reaction field force without particles.
+
+        Raises
+        ------
+        ValueError
+            If ``switch_width`` is not None or zero.
+
+        """
+        if switch_width is not None and switch_width < 0.0*unit.nanometers:
+            raise ValueError('The switch width ({}) must be non-negative.'.format(switch_width))
+        if switch_width is not None and switch_width > 0.0*unit.nanometers:
+            raise ValueError('NonbondedForce cannot switch electrostatics; '
+                             'use switch_width=None to build a native force.')
+        nonbonded_force = openmm.NonbondedForce()
+        nonbonded_force.setNonbondedMethod(openmm.NonbondedForce.CutoffPeriodic)
+        nonbonded_force.setCutoffDistance(cutoff_distance)
+        nonbonded_force.setReactionFieldDielectric(reaction_field_dielectric)
+        nonbonded_force.setUseSwitchingFunction(False)
+        nonbonded_force.setUseDispersionCorrection(False)
+        return nonbonded_force
+
+
+class UnshiftedReactionFieldForce(_ReactionFieldBase):
+    """A force modelling switched reaction-field electrostatics.
+
+    Contrarily to a normal `NonbondedForce` with `CutoffPeriodic` nonbonded
+    method, this force sets the `c_rf` to 0.0 and uses a switching function
+    to avoid forces discontinuities at the cutoff distance.
+
+    Parameters
+    ----------
+    cutoff_distance : openmm.unit.Quantity, default 15*angstroms
+        The cutoff distance (units of distance).
+    switch_width : openmm.unit.Quantity, default 1.0*angstrom
+        Switch width for electrostatics (units of distance). If None or
+        zero, the potential is truncated at the cutoff.
+    reaction_field_dielectric : float
+        The dielectric constant used for the solvent.
+    tabulated : bool, default False
+        If True, the distance dependence of the potential is interpolated
+        from a cubic spline tabulated between 0 and the cutoff distance
+        instead of being evaluated analytically.
+
+    Raises
+    ------
+    ValueError
+        If ``switch_width`` is negative or not smaller than ``cutoff_distance``.
+
+    """
+
+    def __init__(self, cutoff_distance=15*unit.angstroms, switch_width=1.0*unit.angstrom,
+                 reaction_field_dielectric=78.3, tabulated=False):
+        # Energy expression omits c_rf constant term.
+        super(UnshiftedReactionFieldForce, self).__init__(
+            cutoff_distance, switch_width, reaction_field_dielectric,
+            tabulated=tabulated, shifted=False)
+
+
+class SwitchedReactionFieldForce(_ReactionFieldBase):
+    """A force modelling switched reaction-field electrostatics.
+
+    Parameters
+    ----------
+    cutoff_distance : openmm.unit.Quantity, default 15*angstroms
+        The cutoff distance (units of distance).
+    switch_width : openmm.unit.Quantity, default 1.0*angstrom
+        Switch width for electrostatics (units of distance). If None or
+        zero, the potential is truncated at the cutoff.
+    reaction_field_dielectric : float
+        The dielectric constant used for the solvent.
+    tabulated : bool, default False
+        If True, the distance dependence of the potential is interpolated
+        from a cubic spline tabulated between 0 and the cutoff distance
+        instead of being evaluated analytically.
+
+    Raises
+    ------
+    ValueError
+        If ``switch_width`` is negative or not smaller than ``cutoff_distance``.
+
+    """
+
+    def __init__(self, cutoff_distance=15*unit.angstroms, switch_width=1.0*unit.angstrom,
+                 reaction_field_dielectric=78.3, tabulated=False):
+        super(SwitchedReactionFieldForce, self).__init__(
+            cutoff_distance, switch_width, reaction_field_dielectric,
+            tabulated=tabulated, shifted=True)
 
 
 if __name__ == '__main__':
@@ -231,3 +231,23 @@ def test_replace_reaction_field():
             name=test_name,
             platform=platform,
         )
+
+    for test_system in test_cases:
+        test_name = test_system.__class__.__name__
+
+        # Replace reaction field with the tabulated kernel.
+        modified_rf_system = replace_reaction_field(
+            test_system.system, switch_width=None, shifted=True, tabulated=True
+        )
+
+        # Make sure positions are not at minimum.
+        positions = generate_new_positions(test_system.system, test_system.positions)
+
+        # Test forces.
+        compare_system_forces(
+            test_system.system,
+            modified_rf_system,
+            positions,
+            name=test_name,
+            platform=platform,
+        )
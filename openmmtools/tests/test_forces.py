@@ -419,3 +419,95 @@ class TestRadiallySymmetricRestraints:
                 square_well=True,
                 max_volume=max_volume,
             )
+
+
+# =============================================================================
+# REACTION FIELD TESTS
+# =============================================================================
+
+
+def get_reaction_field_test_case():
+    """Return the cutoff, box edge, charges and positions of a small periodic test case."""
+    cutoff_distance = 1.0 * unit.nanometers
+    box_edge = 3.0 * unit.nanometers
+    charges = [0.5, -0.5, 1.0, -1.0]
+    positions = unit.Quantity(
+        [[0.0, 0.0, 0.0], [0.3, 0.0, 0.0], [0.0, 0.6, 0.0], [0.0, 0.0, 0.9]],
+        unit.nanometers,
+    )
+    return cutoff_distance, box_edge, charges, positions
+
+
+def compute_reaction_field_energy(force, charges, positions, box_edge):
+    """Compute the energy of a reaction field force on a set of charges."""
+    system = openmm.System()
+    system.setDefaultPeriodicBoxVectors(*(np.eye(3) * box_edge))
+    for _ in charges:
+        system.addParticle(1.0)
+    system.addForce(force)
+    integrator = openmm.VerletIntegrator(1.0 * unit.femtoseconds)
+    platform = openmm.Platform.getPlatformByName("Reference")
+    context = openmm.Context(system, integrator, platform)
+    context.setPositions(positions)
+    energy = context.getState(getEnergy=True).getPotentialEnergy()
+    del context, integrator
+    return energy
+
+
+def test_reaction_field_build_native():
+    """The native NonbondedForce reproduces the truncated SwitchedReactionFieldForce."""
+    cutoff_distance, box_edge, charges, positions = get_reaction_field_test_case()
+
+    custom_force = SwitchedReactionFieldForce(cutoff_distance, switch_width=None)
+    native_force = SwitchedReactionFieldForce.build_native(cutoff_distance)
+    for charge in charges:
+        custom_force.addParticle([charge])
+        native_force.addParticle(charge, 1.0, 0.0)
+
+    custom_energy = compute_reaction_field_energy(custom_force, charges, positions, box_edge)
+    native_energy = compute_reaction_field_energy(native_force, charges, positions, box_edge)
+    # The custom force energy expression is formatted with limited precision.
+    assert utils.is_quantity_close(custom_energy, native_energy, rtol=1e-5)
+
+    # Native NonbondedForce cannot switch electrostatics.
+    with pytest.raises(ValueError):
+        UnshiftedReactionFieldForce.build_native(cutoff_distance, switch_width=0.1 * unit.nanometers)
+
+
+def test_reaction_field_tabulated():
+    """The tabulated kernel reproduces the analytical reaction field energy."""
+    cutoff_distance, box_edge, charges, positions = get_reaction_field_test_case()
+
+    for force_cls in [UnshiftedReactionFieldForce, SwitchedReactionFieldForce]:
+        energies = []
+        for tabulated in [False, True]:
+            force = force_cls(cutoff_distance, switch_width=0.1 * unit.nanometers,
+                              tabulated=tabulated)
+            for charge in charges:
+                force.addParticle([charge])
+            energies.append(compute_reaction_field_energy(force, charges, positions, box_edge))
+        assert utils.is_quantity_close(*energies, rtol=1e-5), force_cls.__name__
+
+
+def test_reaction_field_zero_switch_width():
+    """A zero switch width disables the switching function."""
+    for force_cls in [UnshiftedReactionFieldForce, SwitchedReactionFieldForce]:
+        force = force_cls(switch_width=0.0 * unit.angstroms)
+        assert not force.getUseSwitchingFunction()
+        force = force_cls(switch_width=1.0 * unit.angstroms)
+        assert force.getUseSwitchingFunction()
+
+        # Negative widths are rejected rather than silently truncated.
+        with pytest.raises(ValueError):
+            force_cls(switch_width=-1.0 * unit.angstroms)
+        with pytest.raises(ValueError):
+            force_cls.build_native(switch_width=-1.0 * unit.angstroms)
+
+
+def test_reaction_field_switch_width_validation():
+    """A switch width outside [0, cutoff) raises an error."""
+    cutoff_distance = 1.0 * unit.nanometers
+    for force_cls in [UnshiftedReactionFieldForce, SwitchedReactionFieldForce]:
+        for switch_width in [cutoff_distance, 12.0 * unit.angstroms, -1.0 * unit.angstroms]:
+            with pytest.raises(ValueError):
+                force_cls(cutoff_distance, switch_width=switch_width)